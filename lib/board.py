@@ -24,24 +24,83 @@ from __future__ import annotations
 from collections.abc import Hashable as HashableABC
 from collections.abc import MutableMapping as MutableMappingABC
 from collections.abc import Sequence as SequenceABC
-from copy import copy as shallow_copy
-from enum import Enum, Flag
+from enum import Enum, IntFlag
 from enum import auto as enum_gen
 from enum import unique
+from functools import lru_cache
+from random import Random
+from re import Pattern
+from re import compile as compile_regex
 from typing import Final, Iterator, Mapping, Optional, Sequence, SupportsIndex
 
 from lib import pieces
 
 
+_WIDEN_TABLE: Final[dict[int, int]] = {32: 0x3000} | {
+    i: i + 65248 for i in range(33, 127)
+}
+"""Maps printable ASCII code points to their fullwidth forms, for use with str.translate."""
+
+
 def widen(value: str) -> str:
     """Return a string with all ASCII characters in an input string converted to their fullwidth forms.
 
     Required positional arguments:
     value -- The string to be widened.
     """
-    return "".join(
-        [(chr(ord(i) + 65248) if 33 <= ord(i) < 127 else i) for i in value]
-    ).replace(" ", "\u3000")
+    return value.translate(_WIDEN_TABLE)
+
+
+_FEN_TOKEN: Final[Pattern[str]] = compile_regex(r"([0-9]+)|([^0-9])")
+"""Matches either a run of empty spaces or a single piece symbol in the board section of a FEN."""
+
+
+def _pos_key(file: int, rank: int) -> int:
+    """Return the packed integer used to index the space at the given indices in a board's mailbox."""
+    return file | (rank << 5)
+
+
+_MAILBOX_SIZE: Final[int] = _pos_key(25, 25) + 1
+"""The length of a board's mailbox, which is large enough to hold a 26 by 26 board."""
+
+_ZOBRIST_RANDOM: Final[Random] = Random()
+"""The source of the random bitstrings used for Zobrist hashing."""
+_ZOBRIST_PIECE_KEYS: Final[dict[tuple[type, pieces.Color], list[int]]] = {}
+"""The Zobrist keys for each square of the mailbox, per piece class and color. Filled in as new kinds of pieces are placed."""
+_ZOBRIST_CASTLING_BITS: Final[list[int]] = [
+    _ZOBRIST_RANDOM.getrandbits(64) for _ in range(4)
+]
+_ZOBRIST_CASTLING_KEYS: Final[list[int]] = [0] * 16
+"""The Zobrist keys for each combination of castling rights, indexed by the value of the flag."""
+for _castling_value in range(1, 16):
+    _ZOBRIST_CASTLING_KEYS[_castling_value] = (
+        _ZOBRIST_CASTLING_KEYS[_castling_value & (_castling_value - 1)]
+        ^ _ZOBRIST_CASTLING_BITS[(_castling_value & -_castling_value).bit_length() - 1]
+    )
+del _castling_value, _ZOBRIST_CASTLING_BITS
+_ZOBRIST_EN_PASSANT_KEYS: Final[list[int]] = [
+    _ZOBRIST_RANDOM.getrandbits(64) for _ in range(_MAILBOX_SIZE)
+]
+"""The Zobrist keys for each possible en passant square."""
+_ZOBRIST_TURN_KEYS: Final[dict[pieces.Color, int]] = {
+    pieces.Color.WHITE: 0,
+    pieces.Color.BLACK: _ZOBRIST_RANDOM.getrandbits(64),
+}
+"""The Zobrist keys for each player to move."""
+
+
+def _zobrist_piece_key(piece: pieces.Piece, square: int) -> int:
+    """Return the Zobrist key for the given piece standing on the given square of a mailbox.
+
+    Required positional arguments:
+    piece -- The piece to get the key of.
+    square -- The index of the square that the piece is on.
+    """
+    keys: Optional[list[int]] = _ZOBRIST_PIECE_KEYS.get((type(piece), piece.color))
+    if keys is None:
+        keys = [_ZOBRIST_RANDOM.getrandbits(64) for _ in range(_MAILBOX_SIZE)]
+        _ZOBRIST_PIECE_KEYS[type(piece), piece.color] = keys
+    return keys[square]
 
 
 @unique
@@ -62,7 +121,7 @@ class BoardArchiveMode(Enum):
     """Keep archives throughout the whole game."""
 
 
-class CastlingRights(Flag):
+class CastlingRights(IntFlag):
     """A player's right to castle in a certian direction.
 
     Enumeration members:
@@ -80,6 +139,15 @@ class CastlingRights(Flag):
     BLACK_QUEENSIDE = enum_gen()
 
 
+_CASTLE_MAP: Final[dict[str, CastlingRights]] = {
+    "K": CastlingRights.WHITE_KINGSIDE,
+    "Q": CastlingRights.WHITE_QUEENSIDE,
+    "k": CastlingRights.BLACK_KINGSIDE,
+    "q": CastlingRights.BLACK_QUEENSIDE,
+}
+"""The castling right bits for each letter in the castling section of a FEN."""
+
+
 class Coordinate(HashableABC, SequenceABC):
     """A location on a board.
 
@@ -89,7 +157,9 @@ class Coordinate(HashableABC, SequenceABC):
     __eq__
     __getitem__
     __hash__
+    __iter__
     __len__
+    __reduce__
     __repr__
     __str__
 
@@ -101,13 +171,15 @@ class Coordinate(HashableABC, SequenceABC):
     Sequence -- Acts as a two-element sequence of file, rank.
     """
 
-    def __init__(
-        self,
+    __slots__ = ("_hash", "_location", "_repr", "_str")
+
+    def __new__(
+        cls,
         position_or_file: str | Sequence[SupportsIndex] | complex | SupportsIndex,
         rank: Optional[SupportsIndex] = None,
         /,
-    ) -> None:
-        """Create a new coordinate pointing to the given space.
+    ) -> Coordinate:
+        """Return the coordinate pointing to the given space. Every coordinate is created when the module loads, so equal coordinates are always the same object.
 
         Required positional arguments:
         position_or_file -- If a string, should specify the space in standard notation. If a sequence, should be a zero-indexed file, rank pair. If a complex number, the real component is used as the file index, and the imaginary component is used as the rank index. If an integer, should be a file index.
@@ -116,7 +188,9 @@ class Coordinate(HashableABC, SequenceABC):
         rank -- If position_or_file is a file index, should be the rank index. Otherwise, should not be specified.
         """
         pos_value: tuple[int, int]
-        if isinstance(position_or_file, str):
+        if type(position_or_file) is int and type(rank) is int:
+            pos_value = (position_or_file, rank)
+        elif isinstance(position_or_file, str):
             if rank is not None:
                 raise TypeError("Coordinate(str) does not take second argument")
             elif not 2 <= len(position_or_file) < 4:
@@ -132,7 +206,9 @@ class Coordinate(HashableABC, SequenceABC):
                     f"position_or_file must end with an integer between 1 and 26 (not {position_or_file[1:]})"
                 )
             pos_value = (ord(position_or_file[0]) - 97, int(position_or_file[1:]) - 1)
-        elif isinstance(position_or_file, Sequence):
+        elif type(position_or_file) in (tuple, list) or isinstance(
+            position_or_file, Sequence
+        ):
             if rank is not None:
                 raise TypeError("Coordinate(Sequence) does not take second argument")
             elif len(position_or_file) != 2:
@@ -173,10 +249,28 @@ class Coordinate(HashableABC, SequenceABC):
             raise IndexError(
                 f"rank index must be between 0 and 25 (not {pos_value[1]})"
             )
-        self._location: Final[tuple[int, int]] = pos_value
+        return cls._from_indices(*pos_value)
+
+    @classmethod
+    def _from_indices(cls, file: int, rank: int) -> Coordinate:
+        """Return the coordinate for the given indices. The indices are not validated.
+
+        Required positional arguments:
+        file -- The file index, between 0 and 25.
+        rank -- The rank index, between 0 and 25.
+        """
+        return _COORDINATE_CACHE[_pos_key(file, rank)]
 
     def __add__(self, other: Sequence[SupportsIndex], /) -> Coordinate:
         """Offset this coordinate by the sequence's values, and return the shifted coordinate"""
+        if type(other) is tuple and len(other) == 2:
+            file_offset, rank_offset = other
+            if type(file_offset) is int and type(rank_offset) is int:
+                new_file: Final[int] = self._location[0] + file_offset
+                new_rank: Final[int] = self._location[1] + rank_offset
+                if 0 <= new_file < 26 and 0 <= new_rank < 26:
+                    return Coordinate._from_indices(new_file, new_rank)
+                return Coordinate(new_file, new_rank)
         if (
             isinstance(other, Sequence)
             and len(other) == 2
@@ -184,16 +278,19 @@ class Coordinate(HashableABC, SequenceABC):
             and isinstance(other[1], SupportsIndex)
         ):
             return Coordinate(
-                self.file + other[0].__index__(), self.rank + other[1].__index__()
+                self._location[0] + other[0].__index__(),
+                self._location[1] + other[1].__index__(),
             )
         return NotImplemented
 
     def __complex__(self) -> complex:
-        return complex(*self)
+        return complex(*self._location)
 
     def __eq__(self, other: Coordinate, /) -> bool:
+        if self is other:
+            return True
         return (
-            self.file == other.file and self.rank == other.rank
+            self._location == other._location
             if isinstance(other, Coordinate)
             else NotImplemented
         )
@@ -201,39 +298,245 @@ class Coordinate(HashableABC, SequenceABC):
     @property
     def file(self) -> int:
         """The file index of this coordinate."""
-        return self[0]
+        return self._location[0]
 
     def __getitem__(self, key: int, /) -> int:
         return self._location[key]
 
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._location)
+
     def __hash__(self) -> int:
-        return self.file + (self.rank << 5)
+        return self._hash
 
     def __len__(self) -> int:
         return 2
 
+    def __reduce__(self) -> tuple[type, tuple[int, int]]:
+        return Coordinate, self._location
+
     @property
     def rank(self) -> int:
         """The rank index of this coordinate."""
-        return self[1]
+        return self._location[1]
 
     def __repr__(self) -> str:
-        return f"Coordinate({str(self)!r})"
+        return self._repr
 
     def __str__(self) -> str:
-        return chr(self.file + 97) + str(self.rank + 1)
+        return self._str
+
+
+_COORDINATE_CACHE: Final[list[Optional[Coordinate]]] = [None] * _MAILBOX_SIZE
+"""Every coordinate, indexed by the packed integer of its space."""
+for _file in range(26):
+    for _rank in range(26):
+        _coordinate = object.__new__(Coordinate)
+        _coordinate._hash = _pos_key(_file, _rank)
+        _coordinate._location = (_file, _rank)
+        _coordinate._str = chr(_file + 97) + str(_rank + 1)
+        _coordinate._repr = f"Coordinate({_coordinate._str!r})"
+        _COORDINATE_CACHE[_coordinate._hash] = _coordinate
+del _file, _rank, _coordinate
+
+
+def _parse_layout(
+    board_fen: str, piece_table: Mapping[str, type]
+) -> tuple[int, int, tuple[tuple[int, Coordinate, type, pieces.Color], ...]]:
+    """Return the number of ranks, the number of files, and the pieces described by the board section of a FEN. Each piece is given as its square index, location, class, and color.
+
+    Required positional arguments:
+    board_fen -- The board section of a FEN.
+    piece_table -- A mapping with keys being character in the FEN, and values being the piece class that should be instantiated by it.
+    """
+    rank_data: Final[list[str]] = board_fen.split("/")[::-1]
+    if len(rank_data) > 26:
+        raise ValueError("board cannot have more than 26 ranks")
+    fen_kinds: Final[dict[str, tuple[type, pieces.Color]]] = {}
+    black_symbol: str
+    for symbol, piece_class in piece_table.items():
+        if symbol.upper() != symbol:
+            continue
+        black_symbol = symbol.lower()
+        if black_symbol == symbol:
+            fen_kinds[symbol] = (piece_class, pieces.Color.NEUTRAL)
+        else:
+            fen_kinds[symbol] = (piece_class, pieces.Color.WHITE)
+            fen_kinds[black_symbol] = (piece_class, pieces.Color.BLACK)
+    file: int
+    num_files: Optional[int] = None
+    kind: Optional[tuple[type, pieces.Color]]
+    placements: Final[list[tuple[int, Coordinate, type, pieces.Color]]] = []
+    for rank, rank_string in enumerate(rank_data):
+        file = 0
+        for run_length, char in _FEN_TOKEN.findall(rank_string):
+            if run_length:
+                file += int(run_length)
+            else:
+                if file >= 26:
+                    raise ValueError("board cannot have more than 26 files")
+                kind = fen_kinds.get(char)
+                if kind is None:
+                    raise ValueError(f"fen contains unknown piece symbol {char!r}")
+                placements.append(
+                    (_pos_key(file, rank), Coordinate._from_indices(file, rank), *kind)
+                )
+                file += 1
+        if file != num_files:
+            if num_files is None:
+                num_files = file
+            else:
+                raise ValueError("board cannot have non-square shape")
+    if num_files > 26:
+        raise ValueError("board cannot have more than 26 files")
+    return len(rank_data), num_files, tuple(placements)
+
+
+def _bitboard_coordinates(bitboard: int) -> Iterator[Coordinate]:
+    """Yield the coordinate of each set bit in a bitboard, in mailbox order.
+
+    Required positional arguments:
+    bitboard -- An integer with a bit set for each occupied mailbox square.
+    """
+    lowest_bit: int
+    square: int
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        square = lowest_bit.bit_length() - 1
+        yield Coordinate._from_indices(square & 31, square >> 5)
+        bitboard ^= lowest_bit
+
+
+@lru_cache(maxsize=32)
+def _render_frame(
+    files: int, ranks: int, fullwidth: bool, perspective: pieces.Color
+) -> tuple[str, str, tuple[str, ...], tuple[str, ...], range, range]:
+    """Return the parts of a rendered board that do not depend on its contents: the file label line, the border line, the left and right label of each rank, and the order to draw files and ranks in. Results are cached, since a board is usually redrawn with the same size and options.
+
+    Required positional arguments:
+    files -- The number of files on the board.
+    ranks -- The number of ranks on the board.
+    fullwidth -- Whether the board should use fullwidth characters for the edges.
+    perspective -- Which player should be displayed at the bottom.
+    """
+    rank_label_length: Final[int] = (ranks >= 10) + 1
+    file_label_offset: Final[str] = ("\u3000" if fullwidth else " ") * (
+        rank_label_length + 1
+    )
+    perspective_ordering_temp: slice
+    match perspective:
+        case pieces.Color.WHITE:
+            perspective_ordering_temp = slice(None)
+        case pieces.Color.BLACK:
+            perspective_ordering_temp = slice(None, None, -1)
+    perspective_ordering: Final[slice] = perspective_ordering_temp
+    first_file_label: Final[int] = 0xFF41 if fullwidth else 97
+    file_labels: Final[str] = "".join(
+        map(chr, range(first_file_label, first_file_label + files))
+    )[perspective_ordering]
+    board_top_bottom_border: Final[str] = ("\uFF0D" if fullwidth else "-") * files
+    left_rank_labels: list[str] = [
+        f"{str(rank + 1).rjust(rank_label_length)}|" for rank in range(ranks)
+    ]
+    right_rank_labels: list[str] = [f"|{rank + 1}" for rank in range(ranks)]
+    if fullwidth:
+        left_rank_labels = list(map(widen, left_rank_labels))
+        right_rank_labels = list(map(widen, right_rank_labels))
+    return (
+        f"{file_label_offset}{file_labels}",
+        f"{file_label_offset}{board_top_bottom_border}",
+        tuple(left_rank_labels),
+        tuple(right_rank_labels),
+        range(files)[perspective_ordering],
+        range(ranks)[perspective_ordering][::-1],
+    )
+
+
+_SYMBOLS_BY_KIND_CACHE: Final[
+    dict[
+        int,
+        tuple[
+            Mapping[frozenset[type | pieces.Color], str],
+            dict[tuple[type, pieces.Color], str],
+        ],
+    ]
+] = {}
+"""Flattened piece symbol mappings, keyed by the identity of the original mapping. Each entry keeps the original alive so that its identity is not reused."""
+
+
+def _symbols_by_kind(
+    piece_symbols: Mapping[frozenset[type | pieces.Color], str]
+) -> dict[tuple[type, pieces.Color], str]:
+    """Return the given piece symbols keyed by (class, color) tuples. Results are cached by the identity of the mapping, since boards are rendered with the same few constant symbol sets; a mapping should not be modified after it has been rendered with.
+
+    Required positional arguments:
+    piece_symbols -- The strings used to represent pieces. Keys should be a frozenset containing exactly one piece class and one color.
+    """
+    cached: Final[
+        Optional[
+            tuple[
+                Mapping[frozenset[type | pieces.Color], str],
+                dict[tuple[type, pieces.Color], str],
+            ]
+        ]
+    ] = _SYMBOLS_BY_KIND_CACHE.get(id(piece_symbols))
+    if cached is not None and cached[0] is piece_symbols:
+        return cached[1]
+    symbols_by_kind: Final[dict[tuple[type, pieces.Color], str]] = {}
+    first_member: type | pieces.Color
+    second_member: type | pieces.Color
+    for kind, symbol in piece_symbols.items():
+        if len(kind) == 2:
+            first_member, second_member = kind
+            if isinstance(first_member, type) and isinstance(
+                second_member, pieces.Color
+            ):
+                symbols_by_kind[first_member, second_member] = symbol
+                continue
+            elif isinstance(first_member, pieces.Color) and isinstance(
+                second_member, type
+            ):
+                symbols_by_kind[second_member, first_member] = symbol
+                continue
+        raise ValueError(
+            f"piece_symbols keys must contain exactly one piece class and one color (not {kind!r})"
+        )
+    if len(_SYMBOLS_BY_KIND_CACHE) >= 32:
+        _SYMBOLS_BY_KIND_CACHE.clear()
+    _SYMBOLS_BY_KIND_CACHE[id(piece_symbols)] = piece_symbols, symbols_by_kind
+    return symbols_by_kind
+
+
+@lru_cache(maxsize=32)
+def _standard_layout(
+    board_fen: str, piece_table_items: tuple[tuple[str, type], ...]
+) -> tuple[int, int, tuple[tuple[int, Coordinate, type, pieces.Color], ...]]:
+    """Return the layout of the board section of a FEN using the standard piece table. Results are cached, since most boards start from the same few positions.
+
+    Required positional arguments:
+    board_fen -- The board section of a FEN.
+    piece_table_items -- The current items of the standard piece table. Part of the cache key, so that changes to the table are not hidden by cached layouts.
+    """
+    return _parse_layout(board_fen, dict(piece_table_items))
 
 
 class Board(MutableMappingABC):
     """A chess board.
 
     Instance methods:
+    clear
+    __contains__
     __delitem__
     __eq__
+    get
     increment_halfmove
     __iter__
+    iter_occupied
     __getitem__
     __len__
+    piece_at
+    pop
+    positions_of
     render
     reset_halfmove
     __setitem__
@@ -246,6 +549,7 @@ class Board(MutableMappingABC):
     pawn_ranks (Read-only)
     ranks (Read-only)
     turn
+    zobrist (Read-only)
 
     Usable as:
     Mutable Mapping -- Contains the pieces on the board. Coordinates are keys, and pieces are values.
@@ -269,76 +573,40 @@ class Board(MutableMappingABC):
         archive_mode -- Conditions for storing position archives.
         pawn_ranks -- A mapping with keys being player colors and values being the rank that pawns can double-move. If empty, auto-fills to the second rank from the edge. If only one is specified, the other is automatically calculated to be the same distance from the edge.
         """
-        for symbol in piece_table:
-            if len(symbol) != 1:
-                raise ValueError(
-                    f"piece_table keys must be of length 1 (not {len(symbol)})"
-                )
+        if piece_table is not pieces.STANDARD_PIECE_TABLE:
+            for symbol in piece_table:
+                if len(symbol) != 1:
+                    raise ValueError(
+                        f"piece_table keys must be of length 1 (not {len(symbol)})"
+                    )
         fen_components: Final[list[str]] = fen.split(" ")
         if len(fen_components) != 6:
             raise ValueError("fen parameter is not valid fen")
-        rank_data: Final[list[str]] = fen_components[0].split("/")[::-1]
-        self._ranks: Final[int] = len(rank_data)
+        num_ranks: int
+        num_files: int
+        placements: tuple[tuple[int, Coordinate, type, pieces.Color], ...]
+        num_ranks, num_files, placements = (
+            _standard_layout(fen_components[0], tuple(piece_table.items()))
+            if piece_table is pieces.STANDARD_PIECE_TABLE
+            else _parse_layout(fen_components[0], piece_table)
+        )
+        self._ranks: Final[int] = num_ranks
         for color, rank in pawn_ranks.items():
             if color not in pieces.PLAYER_COLORS:
                 raise ValueError(
                     f"pawn_ranks keys must be either Color.WHITE or Color.BLACK (not {color!r})"
                 )
-            elif 0 <= rank.__index__() < self._ranks:
+            elif not 0 <= rank.__index__() < self._ranks:
                 raise ValueError("values of pawn_ranks must be within the board")
-        if self._ranks > 26:
-            raise ValueError("board cannot have more than 26 ranks")
         self.archive_mode: Final[BoardArchiveMode] = archive_mode
         """Conditions for storing position archives."""
-        digit_buffer: str = ""
-        file: int
-        num_files: Optional[int] = None
-        self._piece_array: Final[dict[Coordinate, pieces.Piece]] = {}
-        for rank in range(self._ranks):
-            file = 0
-            for char in rank_data[rank]:
-                if char.isdigit():
-                    digit_buffer += char
-                else:
-                    if digit_buffer:
-                        file += int(digit_buffer)
-                        digit_buffer = ""
-                    pos: Coordinate = Coordinate(file, rank)
-                    self._piece_array[pos] = piece_table[char.upper()](
-                        pos,
-                        pieces.Color.BLACK
-                        if char.islower()
-                        else (
-                            pieces.Color.WHITE
-                            if char.isupper()
-                            else pieces.Color.NEUTRAL
-                        ),
-                        self,
-                    )
-                    file += 1
-            if digit_buffer:
-                file += int(digit_buffer)
-                digit_buffer = ""
-            if file != num_files:
-                if num_files is None:
-                    num_files = file
-                else:
-                    raise ValueError("board cannot have non-square shape")
-        if num_files > 25:
-            raise ValueError("board cannot have more than 26 files")
+        self._squares: Final[list[Optional[pieces.Piece]]] = [None] * _MAILBOX_SIZE
+        self._bitboards: Final[dict[tuple[type, pieces.Color], int]] = {}
+        self._occupied: int = 0
+        self._zobrist: int = 0
+        for square, pos, piece_class, color in placements:
+            self._place_piece(square, piece_class(pos, color, self))
         self._files: Final[int] = num_files
-        assert all(
-            [pos == piece.pos for pos, piece in self._piece_array.items()]
-        ), "position desync detected"
-        assert all(
-            [self is piece.board for piece in self._piece_array.values()]
-        ), "board reference desync detected"
-        assert all(
-            [
-                (pos.file <= self._files and pos.rank <= self.ranks)
-                for pos in self._piece_array
-            ]
-        ), "piece exists outside of board edge"
         self.turn: pieces.Color
         """The color of the player to move."""
         match fen_components[1]:
@@ -350,16 +618,11 @@ class Board(MutableMappingABC):
                 raise ValueError("current turn must be either 'w' or 'b'")
         self.first_player: Final[pieces.Color] = self.turn
         """The color who moves first."""
-        self.castling_rights: CastlingRights = CastlingRights.NONE
+        castling_value: int = 0
+        for char in fen_components[2]:
+            castling_value |= _CASTLE_MAP.get(char, 0)
+        self.castling_rights: CastlingRights = CastlingRights(castling_value)
         """The castling rights of the players."""
-        if "K" in fen_components[2]:
-            self.castling_rights |= CastlingRights.WHITE_KINGSIDE
-        if "Q" in fen_components[2]:
-            self.castling_rights |= CastlingRights.WHITE_QUEENSIDE
-        if "k" in fen_components[2]:
-            self.castling_rights |= CastlingRights.BLACK_KINGSIDE
-        if "q" in fen_components[2]:
-            self.castling_rights |= CastlingRights.BLACK_QUEENSIDE
         self.en_passant: Optional[Coordinate] = (
             None if fen_components[3] == "-" else Coordinate(fen_components[3])
         )
@@ -367,29 +630,51 @@ class Board(MutableMappingABC):
         """The number of half-moves since the last reset."""
         self.fullmove_clock: int = int(fen_components[5])
         """The current turn number."""
-        pawn_ranks_mem: Mapping[pieces.Color, int]
-        match dict(pawn_ranks):
-            case {}:
-                pawn_ranks_mem = {pieces.Color.WHITE: 1, pieces.Color.BLACK: self._ranks - 2}
-            case {pieces.Color.WHITE: white_pawn_rank}:
-                pawn_ranks_mem = pawn_ranks | {pieces.Color.BLACK: self._ranks - 1 - white_pawn_rank}
-            case {pieces.Color.BLACK: black_pawn_rank}:
-                pawn_ranks_mem = {pieces.Color.WHITE: self._ranks - 1 - black_pawn_rank} | pawn_ranks
-            case {pieces.Color.WHITE: _, pieces.Color.BLACK: _}:
-                pawn_ranks_mem = dict(pawn_ranks)
-            case {pieces.Color.BLACK: black_pawn_rank, pieces.Color.WHITE: white_pawn_rank}:
-                pawn_ranks_mem = {pieces.Color.WHITE: white_pawn_rank, pieces.Color.BLACK: black_pawn_rank}
+        white_pawn_rank: Optional[SupportsIndex] = pawn_ranks.get(pieces.Color.WHITE)
+        black_pawn_rank: Optional[SupportsIndex] = pawn_ranks.get(pieces.Color.BLACK)
+        if white_pawn_rank is None and black_pawn_rank is None:
+            white_pawn_rank = 1
+            black_pawn_rank = self._ranks - 2
+        elif white_pawn_rank is None:
+            white_pawn_rank = self._ranks - 1 - black_pawn_rank.__index__()
+        elif black_pawn_rank is None:
+            black_pawn_rank = self._ranks - 1 - white_pawn_rank.__index__()
+        pawn_ranks_mem: Final[dict[pieces.Color, int]] = {
+            pieces.Color.WHITE: white_pawn_rank.__index__(),
+            pieces.Color.BLACK: black_pawn_rank.__index__(),
+        }
         self._pawn_ranks: Final[dict[pieces.Color, int]] = pawn_ranks_mem
         self.archives: list[BoardArchive] = (
             [] if self.archive_mode is BoardArchiveMode.NONE else [BoardArchive(self)]
         )
 
+    def clear(self) -> None:
+        """Remove every piece from the board."""
+        remaining: int = self._occupied
+        lowest_bit: int
+        while remaining:
+            lowest_bit = remaining & -remaining
+            self._squares[lowest_bit.bit_length() - 1] = None
+            remaining ^= lowest_bit
+        self._bitboards.clear()
+        self._occupied = 0
+        self._zobrist = 0
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, Coordinate) and self._squares[key._hash] is not None
+
     def __delitem__(self, key: Coordinate) -> None:
-        del self._piece_array[key]
+        if not isinstance(key, Coordinate):
+            raise KeyError(key)
+        square: Final[int] = key._hash
+        if self._squares[square] is None:
+            raise KeyError(key)
+        self._remove_piece(square)
 
     def __eq__(self, other: Board) -> bool:
         return (
-            dict(self) == dict(other)
+            self._position_key == other._position_key
+            and self._bitboards == other._bitboards
             and self.castling_rights == other.castling_rights
             and self.files == other.files
             and self.pawn_ranks == other.pawn_ranks
@@ -404,26 +689,127 @@ class Board(MutableMappingABC):
         """The number of files this board has."""
         return self._files
 
+    def get(
+        self, key: Coordinate, default: Optional[pieces.Piece] = None
+    ) -> Optional[pieces.Piece]:
+        """Return the piece at the given location, or default if the space is empty.
+
+        Required positional arguments:
+        key -- The location to look at.
+
+        Optional positional arguments:
+        default -- The value to return if the space is empty.
+        """
+        if not isinstance(key, Coordinate):
+            return default
+        piece: Final[Optional[pieces.Piece]] = self._squares[key._hash]
+        return default if piece is None else piece
+
     def increment_halfmove(self) -> None:
         """Increment the halfmove clock and store a new board archive if necessary."""
         self.halfmove_clock += 1
-        if self.archives is not BoardArchiveMode.NONE:
+        if self.archive_mode is not BoardArchiveMode.NONE:
             self.archives.append(BoardArchive(self))
 
     def __iter__(self) -> Iterator[Coordinate]:
-        return iter(self._piece_array)
+        return _bitboard_coordinates(self._occupied)
+
+    def iter_occupied(self) -> Iterator[tuple[int, int, pieces.Piece]]:
+        """Yield the file index, rank index, and piece for every occupied space, without creating coordinates."""
+        remaining: int = self._occupied
+        lowest_bit: int
+        square: int
+        while remaining:
+            lowest_bit = remaining & -remaining
+            square = lowest_bit.bit_length() - 1
+            yield square & 31, square >> 5, self._squares[square]
+            remaining ^= lowest_bit
 
     def __getitem__(self, key: Coordinate) -> pieces.Piece:
-        return self._piece_array[key]
+        if not isinstance(key, Coordinate):
+            raise KeyError(key)
+        piece: Final[Optional[pieces.Piece]] = self._squares[key._hash]
+        if piece is None:
+            raise KeyError(key)
+        return piece
 
     def __len__(self) -> int:
-        return len(self._piece_array)
+        return self._occupied.bit_count()
+
+    def piece_at(self, file: int, rank: int) -> Optional[pieces.Piece]:
+        """Return the piece on the space with the given indices, or None if it is empty.
+
+        Required positional arguments:
+        file -- The file index of the space.
+        rank -- The rank index of the space.
+        """
+        if not 0 <= file < self._files:
+            raise IndexError(
+                f"file index must be between 0 and {self._files - 1} (not {file})"
+            )
+        elif not 0 <= rank < self._ranks:
+            raise IndexError(
+                f"rank index must be between 0 and {self._ranks - 1} (not {rank})"
+            )
+        return self._squares[_pos_key(file, rank)]
+
+    def _place_piece(self, square: int, piece: pieces.Piece) -> None:
+        """Put a piece on an empty square of the mailbox, updating the bitboards and the Zobrist hash.
+
+        Required positional arguments:
+        square -- The index of the square to place the piece on.
+        piece -- The piece to place.
+        """
+        kind: Final[tuple[type, pieces.Color]] = type(piece), piece.color
+        self._squares[square] = piece
+        self._bitboards[kind] = self._bitboards.get(kind, 0) | 1 << square
+        self._occupied |= 1 << square
+        self._zobrist ^= _zobrist_piece_key(piece, square)
+
+    def pop(self, key: Coordinate, *default: Optional[pieces.Piece]) -> pieces.Piece:
+        """Remove the piece at the given location and return it. If the space is empty, return default if given, otherwise raise KeyError.
+
+        Required positional arguments:
+        key -- The location of the piece to remove.
+
+        Optional positional arguments:
+        default -- The value to return if the space is empty.
+        """
+        piece: Final[Optional[pieces.Piece]] = (
+            self._squares[key._hash] if isinstance(key, Coordinate) else None
+        )
+        if piece is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._remove_piece(key._hash)
+        return piece
+
+    def positions_of(
+        self, piece_type: type, color: pieces.Color
+    ) -> Iterator[Coordinate]:
+        """Return an iterator over the locations of every piece of the given class and color.
+
+        Required positional arguments:
+        piece_type -- The class of the pieces to find.
+        color -- The color of the pieces to find.
+        """
+        return _bitboard_coordinates(self._bitboards.get((piece_type, color), 0))
 
     @property
     def pawn_ranks(self) -> dict[pieces.Color, int]:
         """The ranks that pawns can double-move on."""
         return self._pawn_ranks
 
+    @property
+    def _position_key(self) -> int:
+        """A Zobrist hash of the pieces, the player to move, and the castling rights. This is the part of the position that board archives keep."""
+        return (
+            self._zobrist
+            ^ _ZOBRIST_TURN_KEYS[self.turn]
+            ^ _ZOBRIST_CASTLING_KEYS[self.castling_rights]
+        )
+
     @property
     def ranks(self) -> int:
         """The number of ranks this board has."""
@@ -453,50 +839,69 @@ class Board(MutableMappingABC):
         elif checker_pattern.replace("\n", "") == "":
             raise ValueError("checker_pattern must constain non-newline characters.")
         checker_list: Final[list[str]] = checker_pattern.splitlines()[::-1]
-        rank_label_length: Final[int] = (self.ranks >= 10) + 1
-        file_label_offset: Final[str] = ("\u3000" if fullwidth else " ") * (
-            rank_label_length + 1
+        labels_line: str
+        border_line: str
+        left_rank_labels: tuple[str, ...]
+        right_rank_labels: tuple[str, ...]
+        file_order: range
+        rank_order: range
+        (
+            labels_line,
+            border_line,
+            left_rank_labels,
+            right_rank_labels,
+            file_order,
+            rank_order,
+        ) = _render_frame(self.files, self.ranks, fullwidth, perspective)
+        rows: Final[list[str]] = [labels_line, border_line]
+        checker_rows: Final[list[str]] = [
+            (checker_row * (self.files // len(checker_row) + 1))[: self.files]
+            for checker_row in (
+                checker_list[rank % len(checker_list)] for rank in range(self.ranks)
+            )
+        ]
+        symbols_by_kind: Final[dict[tuple[type, pieces.Color], str]] = (
+            _symbols_by_kind(piece_symbols)
         )
-        perspective_ordering_temp: slice
-        match perspective:
-            case pieces.Color.WHITE:
-                perspective_ordering_temp = slice(None)
-            case pieces.Color.BLACK:
-                perspective_ordering_temp = slice(None, None, -1)
-        perspective_ordering: Final[slice] = perspective_ordering_temp
-        file_labels: Final[str] = (
-            "\uFF41\uFF42\uFF43\uFF44\uFF45\uFF46\uFF47\uFF48\uFF49\uFF4A\uFF4B\uFF4C\uFF4D\uFF4E\uFF4F\uFF50\uFF51\uFF52\uFF53\uFF54\uFF55\uFF56\uFF57\uFF58\uFF59\uFF5A"
-            if fullwidth
-            else "abcdefghijklmnopqrstuvwxyz"
-        )[: self.files][perspective_ordering]
-        board_top_bottom_border: Final[str] = (
-            "\uFF0D" if fullwidth else "-"
-        ) * self.files
-        board_str: str = f"{file_label_offset}{file_labels}\n{file_label_offset}{board_top_bottom_border}\n"
-        checker_rank: int
-        current_rank_label: str
-        for rank in reversed(range(self.ranks)[perspective_ordering]):
-            current_rank_label = f"{str(rank + 1).rjust(rank_label_length)}|"
-            if fullwidth:
-                current_rank_label = widen(current_rank_label)
-            board_str += current_rank_label
-            for file in range(self.files)[perspective_ordering]:
-                try:
-                    current_piece = self[Coordinate(file, rank)]
-                except KeyError:
-                    checker_rank = rank % len(checker_list)
-                    board_str += checker_list[checker_rank][
-                        file % len(checker_list[checker_rank])
-                    ]
+        cells: Final[list[str]] = []
+        checker_row: str
+        current_piece: Optional[pieces.Piece]
+        rank_squares: list[Optional[pieces.Piece]]
+        for rank in rank_order:
+            cells.clear()
+            cells.append(left_rank_labels[rank])
+            checker_row = checker_rows[rank]
+            rank_squares = self._squares[_pos_key(0, rank) : _pos_key(0, rank + 1)]
+            for file in file_order:
+                current_piece = rank_squares[file]
+                if current_piece is None:
+                    cells.append(checker_row[file])
                 else:
-                    board_str += piece_symbols[
-                        frozenset({type(current_piece), current_piece.color})
-                    ]
-            current_rank_label = f"|{rank + 1}"
-            if fullwidth:
-                current_rank_label = widen(current_rank_label)
-            board_str += f"{current_rank_label}\n"
-        return f"{board_str}{file_label_offset}{board_top_bottom_border}\n{file_label_offset}{file_labels}"
+                    cells.append(
+                        symbols_by_kind[type(current_piece), current_piece.color]
+                    )
+            cells.append(right_rank_labels[rank])
+            rows.append("".join(cells))
+        rows.append(border_line)
+        rows.append(labels_line)
+        return "\n".join(rows)
+
+    def _remove_piece(self, square: int) -> None:
+        """Take the piece off of an occupied square of the mailbox, updating the bitboards and the Zobrist hash.
+
+        Required positional arguments:
+        square -- The index of the square to clear.
+        """
+        piece: Final[pieces.Piece] = self._squares[square]
+        kind: Final[tuple[type, pieces.Color]] = type(piece), piece.color
+        remaining: Final[int] = self._bitboards[kind] & ~(1 << square)
+        if remaining:
+            self._bitboards[kind] = remaining
+        else:
+            del self._bitboards[kind]
+        self._occupied &= ~(1 << square)
+        self._zobrist ^= _zobrist_piece_key(piece, square)
+        self._squares[square] = None
 
     def reset_halfmove(self) -> None:
         """Reset the halfmove clock and clear the board archives if necessary."""
@@ -506,9 +911,25 @@ class Board(MutableMappingABC):
             self.archives.append(BoardArchive(self))
 
     def __setitem__(self, key: Coordinate, value) -> None:
-        if key.file > self.files or key.rank > self.ranks:
+        if key.file >= self.files or key.rank >= self.ranks:
             raise IndexError("Board keys must point to spaces within the board")
-        self._piece_array[key] = value
+        assert value.pos == key, "position desync detected"
+        assert value.board is self, "board reference desync detected"
+        square: Final[int] = key._hash
+        if self._squares[square] is not None:
+            self._remove_piece(square)
+        self._place_piece(square, value)
+
+    @property
+    def zobrist(self) -> int:
+        """A Zobrist hash of the position, covering the pieces, the player to move, the castling rights, and the en passant square."""
+        return self._position_key ^ (
+            0
+            if self.en_passant is None
+            else _ZOBRIST_EN_PASSANT_KEYS[
+                _pos_key(self.en_passant.file, self.en_passant.rank)
+            ]
+        )
 
 
 class BoardArchive:
@@ -524,31 +945,32 @@ class BoardArchive:
         Required positional arguments:
         source -- The board to create an archive of.
         """
+        self._position_key: Final[int] = source._position_key
         self._castling_rights: Final[CastlingRights] = source.castling_rights
         self._files: Final[int] = source.files
         self._pawn_ranks: Final[dict[pieces.Color, int]] = source.pawn_ranks
-        self._piece_array: Final[dict[Coordinate, pieces.Piece]] = {}
-        for location, piece in source.items():
-            current_piece = shallow_copy(piece)
-            current_piece.board = self
-            self._piece_array[location] = current_piece
+        self._bitboards: Final[dict[tuple[type, pieces.Color], int]] = (
+            source._bitboards.copy()
+        )
         self._ranks: Final[int] = source.ranks
         self._turn: Final[pieces.Color] = source.turn
 
     def __eq__(self, other: BoardArchive | Board) -> bool:
         return (
-            self._castling_rights == other._castling_rights
+            self._position_key == other._position_key
+            and self._castling_rights == other._castling_rights
             and self._files == other._files
             and self._pawn_ranks == other._pawn_ranks
-            and self._piece_array == other._piece_array
+            and self._bitboards == other._bitboards
             and self._ranks == other._ranks
             and self._turn == other._turn
             if isinstance(other, BoardArchive)
             else (
-                self._castling_rights == other.castling_rights
+                self._position_key == other._position_key
+                and self._castling_rights == other.castling_rights
                 and self._files == other.files
                 and self._pawn_ranks == other.pawn_ranks
-                and self._piece_array == dict(other)
+                and self._bitboards == other._bitboards
                 and self._ranks == other.ranks
                 and self._turn == other.turn
                 if isinstance(other, Board)
@@ -29,8 +29,12 @@ from copy import copy as shallow_copy
 from functools import partial
 from os import name as os_name
 from os import system
+from sys import intern
 from types import CodeType as code
-from typing import Any, Callable, Final, Iterator, Mapping, NoReturn
+from typing import Any, Callable, Final, Iterator, Mapping, NoReturn, Optional
+
+_RETRY_PROMPT: Final[str] = "Select a menu item listed.\n"
+"""The prompt shown after the user types something that is not a menu item."""
 
 
 class MenuExit(BaseException):
@@ -62,6 +66,8 @@ class MenuOption(CallableABC, HashableABC, MappingABC):
     Mapping -- Contains a single key-value pair with the name as the key and the action as the item.
     """
 
+    __slots__ = ("_action", "_name")
+
     def __init__(self, name: str, action: Callable) -> None:
         """Create a new menu option with the given name and action.
 
@@ -69,7 +75,7 @@ class MenuOption(CallableABC, HashableABC, MappingABC):
         name -- The string representing the option when a menu containing it is displayed.
         action -- The object that is called when the option is selected. It is called with no arguments.
         """
-        self._name: Final[str] = name
+        self._name: Final[str] = intern(name)
         self._action: Final[Callable] = action
 
     def __call__(self, *args, **kwargs) -> Any:
@@ -116,6 +122,16 @@ class StaticMenu(CallableABC, MutableMappingABC):
     Mutable Mapping -- Contains the menu's options. Keys are the identifers of the options, and values are the options themselves.
     """
 
+    __slots__ = (
+        "_appearance",
+        "_header",
+        "_index_of",
+        "_lines",
+        "_option_width",
+        "_options",
+        "_title",
+    )
+
     def __init__(self, title: str, options: Mapping[str, MenuOption]) -> None:
         """Create a new static menu with the given title and contents.
 
@@ -124,47 +140,43 @@ class StaticMenu(CallableABC, MutableMappingABC):
         options -- A mapping containing the menu's options. Each key is the option's "identifier", displayed left of the vertical bar, and which must be typed by the user to select the option, and its corresponding value is the option that it points to.
         """
         self._options: Final[dict[str, MenuOption]] = shallow_copy(options)
-        menu_option_width: Final[int] = max([len(index) for index in options.keys()])
-        title_offset: Final[str] = " " * (menu_option_width + 1)
-        appearance: str = f"{title_offset}{title}\n{title_offset}{'-' * len(title)}"
-        for index, option in options.items():
-            appearance += f"\n{index.rjust(menu_option_width)}|{option}"
-        self._appearance: Final[str] = appearance
+        self._title: Final[str] = title
+        self._option_width: Final[int] = max(map(len, options))
+        title_offset: Final[str] = " " * (self._option_width + 1)
+        self._header: Final[str] = (
+            f"{title_offset}{title}\n{title_offset}{'-' * len(title)}"
+        )
+        self._lines: Final[list[str]] = [
+            f"{index.rjust(self._option_width)}|{option}"
+            for index, option in options.items()
+        ]
+        self._index_of: Final[dict[str, int]] = {
+            index: line_number for line_number, index in enumerate(options)
+        }
+        self._appearance: Optional[str] = None
 
     def __call__(self) -> None:
         """Repeatedly display this menu and prompt the user to select an option until a StopMenu is raised."""
+        get_option: Final[Callable[[str], Optional[MenuOption]]] = self._options.get
         try:
             while True:
                 clear_screen()
-                print(f"{self}\n")
-                selected_option: MenuOption
-                options: dict[str, MenuOption] = dict(self)
-                try:
-                    selected_option = options[input()]
-                except KeyError:
-                    while True:
-                        try:
-                            selected_option = options[
-                                input("Select a menu item listed.\n")
-                            ]
-                        except KeyError:
-                            pass
-                        else:
-                            break
+                print(self, end="\n\n")
+                selected_option: Optional[MenuOption] = get_option(input())
+                while selected_option is None:
+                    selected_option = get_option(input(_RETRY_PROMPT))
                 selected_option()
         except StopMenu:
             pass
 
     def __delitem__(self, key: str, /) -> None:
-        try:
-            line_number: int = tuple(self._options).index(key) + 2
-        except ValueError:
-            raise KeyError(key)
+        line_number: Final[int] = self._index_of.pop(key)
         del self._options[key]
-        appearance_lines: str = str(self).splitlines()
-        self._appearance = "\n".join(
-            appearance_lines[:line_number] + appearance_lines[line_number + 1 :]
-        )
+        del self._lines[line_number]
+        self._appearance = None
+        for index, later_line_number in self._index_of.items():
+            if later_line_number > line_number:
+                self._index_of[index] = later_line_number - 1
 
     def __getitem__(self, key: str, /) -> MenuOption:
         return self._options[key]
@@ -176,27 +188,24 @@ class StaticMenu(CallableABC, MutableMappingABC):
         return len(self._options)
 
     def __repr__(self) -> str:
-        display_lines: Final[list[str]] = str(self).splitlines()
-        return f"StaticMenu({display_lines[0][display_lines[1].count(' ') :]!r}, {self._options!r})"
+        return f"StaticMenu({self._title!r}, {self._options!r})"
 
     def __setitem__(self, key: str, value: MenuOption) -> None:
         if key in self._options:
             self._options[key] = value
-            line_number: int = tuple(self._options).index(key) + 2
-            appearance_lines: str = str(self).splitlines()
-            self._appearance = "\n".join(
-                appearance_lines[:line_number]
-                + [f"{key.rjust(appearance_lines[1].count(' '))}|{value}"]
-                + appearance_lines[line_number + 1 :]
+            self._lines[self._index_of[key]] = (
+                f"{key.rjust(self._option_width)}|{value}"
             )
         else:
-            self._options[key]
-            self._appearance += (
-                f"\n{key.rjust(str(self).splitlines()[1].count(' '))}|{value}"
-            )
+            self._index_of[key] = len(self._lines)
+            self._options[key] = value
+            self._lines.append(f"{key.rjust(self._option_width)}|{value}")
+        self._appearance = None
 
     def __str__(self) -> str:
         """Return what this menu would look like when displayed."""
+        if self._appearance is None:
+            self._appearance = "\n".join([self._header, *self._lines])
         return self._appearance
 
 
@@ -209,6 +218,7 @@ class DynamicMenu(CallableABC):
     __repr__
 
     Instance attributes:
+    dependencies
     globals
     locals
     options_expression
@@ -224,6 +234,8 @@ class DynamicMenu(CallableABC):
         options_expression: code | str,
         global_context: dict[str, Any],
         local_context: dict[str, Any],
+        *,
+        dependencies: Optional[Callable[[], HashableABC]] = None,
     ) -> None:
         """Create a dynamic menu with the given title and options expression in the context of the given globals and locals.
 
@@ -232,61 +244,116 @@ class DynamicMenu(CallableABC):
         options_expression -- An expression that returns the menu's contents when passed into eval.
         global_context -- The globals of the menu's scope. Should be globals() in most circumstances.
         local_context -- The locals of the menu's scope. Should be locals() in most circumstances.
+
+        Optional keyword arguments:
+        dependencies -- A function returning every value that the expressions depend on. If given, the expressions are only re-evaluated when its result changes.
         """
-        self.title_expression: code | str = title_expression
-        """An expression that returns this menu's title when passed into eval"""
-        self.options_expression: code | str = options_expression
-        """An expression that returns this menu's contents when passed into eval"""
+        self._cache: Optional[
+            tuple[HashableABC, str, Mapping[str, MenuOption], str]
+        ] = None
+        self._options_expression: code
+        self._options_source: code | str
+        self._title_expression: code
+        self._title_source: code | str
+        self.title_expression = title_expression
+        self.options_expression = options_expression
         self.globals: dict[str, Any] = global_context
         """The globals of this menu's scope."""
         self.locals: dict[str, Any] = local_context
         """The locals of this menu's scope."""
+        self.dependencies: Optional[Callable[[], HashableABC]] = dependencies
+        """A function returning every value that this menu's expressions depend on, or None if they should be re-evaluated every time."""
 
     def __call__(self) -> None:
         """Repeatedly display this menu and prompt the user to select an option until a StopMenu is raised."""
         try:
+            appearance: str
+            options: Mapping[str, MenuOption]
             while True:
-                title: str = eval(self.title_expression, self.globals, self.locals)
-                options: Mapping[str, MenuOption] = eval(
-                    self.options_expression, self.globals, self.locals
-                )
-                menu_option_width: Final[int] = max(
-                    [len(index) for index in options.keys()]
-                )
-                title_offset: Final[str] = " " * (menu_option_width + 1)
-                appearance: str = (
-                    f"{title_offset}{title}\n{title_offset}{'-' * len(title)}"
-                )
-                for index, option in options.items():
-                    appearance += f"\n{index.rjust(menu_option_width)}|{option}"
+                _, options, appearance = self._contents()
                 clear_screen()
-                print(f"{appearance}\n")
-                selected_option: MenuOption
-                try:
-                    selected_option = options[input()]
-                except KeyError:
-                    while True:
-                        try:
-                            selected_option = options[
-                                input("Select a menu item listed.\n")
-                            ]
-                        except KeyError:
-                            pass
-                        else:
-                            break
+                print(appearance, end="\n\n")
+                selected_option: Optional[MenuOption] = options.get(input())
+                while selected_option is None:
+                    selected_option = options.get(input(_RETRY_PROMPT))
                 selected_option()
         except StopMenu:
             pass
 
+    def _contents(self) -> tuple[str, Mapping[str, MenuOption], str]:
+        """Return the title, options, and appearance of this menu, reusing the last ones if its dependencies are unchanged and the last appearance if the title is unchanged and the options are the same object."""
+        dependency_values: Final[HashableABC] = (
+            None if self.dependencies is None else self.dependencies()
+        )
+        if (
+            self._cache is not None
+            and self.dependencies is not None
+            and self._cache[0] == dependency_values
+        ):
+            return self._cache[1:]
+        title: Final[str] = eval(self.title_expression, self.globals, self.locals)
+        options: Final[Mapping[str, MenuOption]] = eval(
+            self.options_expression, self.globals, self.locals
+        )
+        appearance: str
+        if (
+            self._cache is not None
+            and self._cache[2] is options
+            and self._cache[1] == title
+        ):
+            appearance = self._cache[3]
+        else:
+            menu_option_width: Final[int] = max(map(len, options))
+            title_offset: Final[str] = " " * (menu_option_width + 1)
+            appearance_lines: Final[list[str]] = [
+                f"{title_offset}{title}",
+                f"{title_offset}{'-' * len(title)}",
+            ]
+            appearance_lines.extend(
+                f"{index.rjust(menu_option_width)}|{option}"
+                for index, option in options.items()
+            )
+            appearance = "\n".join(appearance_lines)
+        self._cache = (dependency_values, title, options, appearance)
+        return title, options, appearance
+
     def generate_static(self) -> StaticMenu:
         """Return a static menu with the current contents of this menu."""
-        return StaticMenu(
-            eval(self.title_expression, self.globals, self.locals),
-            eval(self.options_expression, self.globals, self.locals),
+        title, options, _ = self._contents()
+        return StaticMenu(title, options)
+
+    @property
+    def options_expression(self) -> code:
+        """An expression that returns this menu's contents when passed into eval. Strings assigned to this are compiled immediately."""
+        return self._options_expression
+
+    @options_expression.setter
+    def options_expression(self, value: code | str) -> None:
+        self._options_source = value
+        self._options_expression = (
+            compile(value, "<options_expression>", "eval")
+            if isinstance(value, str)
+            else value
         )
+        self._cache = None
 
     def __repr__(self) -> str:
-        return f"DynamicMenu({self.title_expression!r}, {self.options_expression!r})"
+        return f"DynamicMenu({self._title_source!r}, {self._options_source!r})"
+
+    @property
+    def title_expression(self) -> code:
+        """An expression that returns this menu's title when passed into eval. Strings assigned to this are compiled immediately."""
+        return self._title_expression
+
+    @title_expression.setter
+    def title_expression(self, value: code | str) -> None:
+        self._title_source = value
+        self._title_expression = (
+            compile(value, "<title_expression>", "eval")
+            if isinstance(value, str)
+            else value
+        )
+        self._cache = None
 
 
 def raise_stop_menu() -> NoReturn:
@@ -299,10 +366,33 @@ def raise_break_menu() -> NoReturn:
     raise BreakMenu
 
 
-clear_screen: Final[Callable[[], None]] = partial(
-    system, "cls" if os_name == "nt" else "clear"
-)
-"""Clear the terminal."""
+def _enable_windows_escape_codes() -> bool:
+    """Try to turn on escape code processing in the Windows console, and return whether it succeeded."""
+    from ctypes import byref, c_ulong, windll
+
+    kernel32: Final = windll.kernel32
+    output_handle: Final[int] = kernel32.GetStdHandle(-11)
+    console_mode: Final[c_ulong] = c_ulong()
+    return bool(
+        kernel32.GetConsoleMode(output_handle, byref(console_mode))
+        and kernel32.SetConsoleMode(output_handle, console_mode.value | 0x0004)
+    )
+
+
+_clear_screen_action: Optional[Callable[[], None]] = None
+"""The function used by clear_screen, chosen on its first call."""
+
+
+def clear_screen() -> None:
+    """Clear the terminal."""
+    global _clear_screen_action
+    if _clear_screen_action is None:
+        _clear_screen_action = (
+            partial(system, "cls")
+            if os_name == "nt" and not _enable_windows_escape_codes()
+            else partial(print, "\x1b[H\x1b[2J\x1b[3J", end="", flush=True)
+        )
+    _clear_screen_action()
 
 BACK_OPTION: Final[MenuOption] = MenuOption("BACK", raise_stop_menu)
 """The back option present in many menus."""
@@ -33,7 +33,6 @@ from enum import Enum
 from enum import auto as enum_gen
 from enum import unique
 from functools import cache
-from itertools import product as all_pairs
 from typing import Final, Optional, Sequence, SupportsIndex
 
 from lib import settings
@@ -55,7 +54,7 @@ class Color(Enum):
 
     def next(self) -> Color:
         try:
-            return {Color.WHITE: Color.BLACK, Color.BLACK: Color.WHITE}[self]
+            return _NEXT_COLORS[self]
         except KeyError:
             raise ValueError(f"{self!r} has no next color")
 
@@ -67,6 +66,11 @@ class Color(Enum):
 
 PLAYER_COLORS: Final[frozenset[Color]] = frozenset({Color.WHITE, Color.BLACK})
 """Both player colors."""
+_NEXT_COLORS: Final[dict[Color, Color]] = {
+    Color.WHITE: Color.BLACK,
+    Color.BLACK: Color.WHITE,
+}
+"""The color that moves after each player color."""
 
 from lib import board
 
@@ -106,17 +110,14 @@ class Piece:
         self.pos: board.Coordinate = position
         """The location of this piece."""
 
-    def attacked_by(self) -> frozenset[Piece]:
+    def attacked_by(self) -> tuple[Piece, ...]:
         """Return all enemy pieces that can attack this piece."""
-        attackers: set[Piece] = set()
-        for rank, file in all_pairs(range(self.board.ranks), range(self.board.files)):
-            piece_of_interest = self.board[board.Coordinate(file, rank)]
-            if (
-                self.color is not piece_of_interest.color
-                and self.pos in piece_of_interest.moves()
-            ):
-                attackers.add(piece_of_interest)
-        return frozenset(attackers)
+        return tuple(
+            piece_of_interest
+            for _, _, piece_of_interest in self.board.iter_occupied()
+            if self.color is not piece_of_interest.color
+            and self.pos in piece_of_interest.moves()
+        )
 
     @property
     def color(self) -> Color:
@@ -137,10 +138,9 @@ class Piece:
         self.board.en_passant = None
         self.board.turn = self.board.turn.next()
         self.board.fullmove_clock += self.board.turn == self.board.first_player
-        try:
-            captured_piece: Optional[Piece] = self.board[dest]
-        except KeyError:
-            captured_piece = None
+        captured_piece: Final[Optional[Piece]] = self.board.piece_at(
+            dest.file, dest.rank
+        )
         del self.board[self.pos]
         if promotion is None:
             self.pos = dest
@@ -298,16 +298,15 @@ class Pawn(Piece):
         if dest == self.board.en_passant:
             self.board.en_passant = None
             capture_location: Final[board.Coordinate] = dest + reverse_step
-            try:
-                captured_piece: Optional[Piece] = self.board[capture_location]
+            captured_piece: Optional[Piece] = self.board.piece_at(
+                capture_location.file, capture_location.rank
+            )
+            if captured_piece is not None:
                 del self.board[capture_location]
-            except KeyError:
-                captured_piece = None
         else:
-            try:
-                captured_piece: Optional[Piece] = self.board[dest]
-            except KeyError:
-                captured_piece = None
+            captured_piece: Optional[Piece] = self.board.piece_at(
+                dest.file, dest.rank
+            )
             self.board.en_passant = (
                 dest + reverse_step if abs(self.pos.rank - dest.rank) == 2 else None
             )
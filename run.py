@@ -130,6 +130,7 @@ def main() -> None:
             compile("CHAR_SET_MENU_OPTIONS", __file__, "eval"),
             globals(),
             locals(),
+            dependencies=lambda: settings.user_settings[None]["char_set"],
         )
         CHAR_SET_MENU_OPTIONS: Final[dict[str, menu.MenuOption]] = {
             "?": menu.MenuOption(
@@ -159,6 +160,7 @@ def main() -> None:
             compile("DARK_MODE_MENU_OPTIONS", __file__, "eval"),
             globals(),
             locals(),
+            dependencies=lambda: settings.user_settings[None]["dark_mode"],
         )
         DARK_MODE_MENU_OPTIONS: Final[dict[str, menu.MenuOption]] = {
             "?": menu.MenuOption(
@@ -195,6 +197,10 @@ def main() -> None:
             ),
         )
 
+        HAS_VARIANT_SETTINGS: Final[bool] = any(
+            variant.SETTINGS_MENU is not None for variant in all_variants.values()
+        )
+
         menu.StaticMenu(
             "MAIN MENU",
             {
@@ -210,7 +216,7 @@ def main() -> None:
                                 user_variants.values(), 1
                             )
                         }
-                        | {"<": menu.BACK_OPTION},
+                        | BACK_OPTION_DICT,
                     ),
                 ),
                 "2": menu.MenuOption("SANDBOX", builtin_variants["sandbox"].main),
@@ -219,12 +225,16 @@ def main() -> None:
                     menu.DynamicMenu(
                         compile("'SETTINGS'", __file__, "eval"),
                         compile(
-                            "{'1': menu.MenuOption(f'CHARACTER SET: {settings.user_settings[None][\"char_set\"].name}', CHAR_SET_MENU), '2': menu.MenuOption('DARK MODE: ON' if settings.user_settings[None]['dark_mode'] else 'DARK MODE: OFF', DARK_MODE_MENU)} | ({} if all([variant.SETTINGS_MENU is None for variant in all_variants.values()]) else {'...': VARIANT_SPECIFIC_SETTINGS_MENU_OPTION}) | BACK_OPTION_DICT",
+                            "{'1': menu.MenuOption(f'CHARACTER SET: {settings.user_settings[None][\"char_set\"].name}', CHAR_SET_MENU), '2': menu.MenuOption('DARK MODE: ON' if settings.user_settings[None]['dark_mode'] else 'DARK MODE: OFF', DARK_MODE_MENU)} | ({'...': VARIANT_SPECIFIC_SETTINGS_MENU_OPTION} if HAS_VARIANT_SETTINGS else {}) | BACK_OPTION_DICT",
                             __file__,
                             "eval",
                         ),
                         globals(),
                         locals(),
+                        dependencies=lambda: (
+                            settings.user_settings[None]["char_set"],
+                            settings.user_settings[None]["dark_mode"],
+                        ),
                     ),
                 ),
                 "X": menu.MenuOption("QUIT", menu.raise_stop_menu),
@@ -186,25 +186,27 @@ def main() -> None:
     try:
         while True:
             if input_error_prompt == "":
-                board_str: str = f"{file_label_offset}{file_labels}\n{file_label_offset}{board_top_bottom_border}\n"
-                checker_rank: int
+                board_parts: list[str] = [
+                    f"{file_label_offset}{file_labels}\n{file_label_offset}{board_top_bottom_border}\n"
+                ]
+                checker_row: str
+                file_order: range = range(game_board.files)[perspective_ordering]
                 for rank in reversed(range(game_board.ranks)[perspective_ordering]):
-                    board_str += f"{str(rank + 1).rjust(rank_label_length)}|"
-                    for file in range(game_board.files)[perspective_ordering]:
-                        try:
-                            current_piece = game_board[board.Coordinate(file, rank)]
-                        except KeyError:
-                            checker_rank = rank % len(checker_list)
-                            board_str += checker_list[checker_rank][
-                                file % len(checker_list[checker_rank])
-                            ]
+                    board_parts.append(f"{str(rank + 1).rjust(rank_label_length)}|")
+                    checker_row = checker_list[rank % len(checker_list)]
+                    checker_row *= game_board.files // len(checker_row) + 1
+                    for file in file_order:
+                        current_piece = game_board.piece_at(file, rank)
+                        if current_piece is None:
+                            board_parts.append(checker_row[file])
                         else:
-                            board_str += current_piece.symbol
-                    board_str += f"|{rank + 1}\n"
-                menu.clear_screen()
-                print(
-                    f"{board_str}{file_label_offset}{board_top_bottom_border}\n{file_label_offset}{file_labels}\n"
+                            board_parts.append(current_piece.symbol)
+                    board_parts.append(f"|{rank + 1}\n")
+                board_parts.append(
+                    f"{file_label_offset}{board_top_bottom_border}\n{file_label_offset}{file_labels}\n"
                 )
+                menu.clear_screen()
+                print("".join(board_parts))
             move = input(input_error_prompt)
             if move == "menu":
                 menu.DynamicMenu(